@@ -11,7 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 # Import and run the server
 if __name__ == "__main__":
-    from remote_mcp.server import app
+    from remote_mcp.server import app, UVICORN_LOOP
     import uvicorn
     
     port = int(os.environ.get("PORT", 8000))
@@ -28,4 +28,4 @@ if __name__ == "__main__":
     print(f"Test with: npx @modelcontextprotocol/inspector --url http://localhost:{port}/mcp")
     print("-" * 60)
     
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    uvicorn.run(app, host=host, port=port, loop=UVICORN_LOOP, http="httptools", log_level="info")
@@ -10,13 +10,17 @@ import os
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from remote_mcp.unified_server import app
+from remote_mcp.unified_server import app, UVICORN_LOOP
 import uvicorn
 
 if __name__ == "__main__":
     # Get configuration from environment
     port = int(os.environ.get("PORT", 8000))
     host = os.environ.get("HOST", "0.0.0.0")
+    # Use "warning" in production to silence per-request access logs
+    log_level = os.environ.get("LOG_LEVEL", "info").lower()
+    # Worker processes sharing the listening socket; state is per-process
+    workers = int(os.environ.get("WORKERS", 1))
     
     print(f"\n{'='*60}")
     print("Starting Unified Server (MCP + Web Interface)")
@@ -25,10 +29,21 @@ if __name__ == "__main__":
     print(f"Web Interface: http://{host}:{port}/")
     print(f"MCP Endpoint: http://{host}:{port}/mcp")
     print(f"Health Check: http://{host}:{port}/health")
+    if workers > 1:
+        print(f"Workers: {workers} (in-memory state is per worker - use sticky sessions)")
     print(f"{'='*60}\n")
     
     try:
-        uvicorn.run(app, host=host, port=port, log_level="info")
+        uvicorn.run(
+            # Multiple workers need an import string so each process can load the app
+            "remote_mcp.unified_server:app" if workers > 1 else app,
+            host=host,
+            port=port,
+            workers=workers,
+            loop=UVICORN_LOOP,
+            http="httptools",
+            log_level=log_level
+        )
     except Exception as e:
         print(f"Server error: {e}")
         sys.exit(1)
@@ -5,6 +5,7 @@ Provides bidirectional event communication with long-polling support
 """
 
 import asyncio
+import itertools
 import json
 import logging
 import uuid
@@ -19,6 +20,8 @@ from contextlib import asynccontextmanager
 import functools
 import weakref
 
+import orjson
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,7 +32,7 @@ logger = logging.getLogger(__name__)
 
 class EventConfig:
     """Event system configuration"""
-    MAX_EVENT_HISTORY = 1000
+    MAX_EVENT_HISTORY = 10_000
     MAX_QUEUE_SIZE = 100
     DEFAULT_TIMEOUT = 30
     MAX_TIMEOUT = 300  # 5 minutes max
@@ -39,6 +42,7 @@ class EventConfig:
     RETRY_DELAY = 1.0
     METRICS_INTERVAL = 300  # Log metrics every 5 minutes
     MAX_CONNECTIONS = 100
+    MAX_CONCURRENT_WAITS = 256  # Long-polls parked at once; extra callers queue
     RATE_LIMIT_EVENTS = 1000  # Max events per minute per connection
     RATE_LIMIT_WINDOW = 60
 
@@ -99,6 +103,7 @@ class Event:
     ttl: int = None  # Time to live in seconds
     retry_count: int = 0
     correlation_id: str = None  # For tracking related events
+    seq: int = 0  # Monotonic sequence number assigned by EventManager.emit
     
     def __post_init__(self):
         """Validate event data"""
@@ -122,6 +127,19 @@ class Event:
         """Convert to JSON string"""
         return json.dumps(self.to_dict(), default=str)
     
+    @functools.cached_property
+    def sse_frame(self) -> bytes:
+        """
+        Encoded SSE message for this event
+        
+        Built on first access and shared by every subscriber, so fan-out
+        serializes the event once rather than once per connection.
+        """
+        data = orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        return b"id: %s\nevent: %s\ndata: %s\n\n" % (
+            self.id.encode(), self.type.value.encode(), data
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Event':
         """Create from dictionary with validation"""
@@ -140,6 +158,14 @@ class Event:
         created = datetime.fromisoformat(self.timestamp)
         return datetime.now() - created > timedelta(seconds=self.ttl)
 
+def parse_event_seq(event_id: str) -> Optional[int]:
+    """Sequence number from an event ID ("evt_42" or "42"), None if not one"""
+    if not event_id:
+        return None
+    digits = event_id[4:] if event_id.startswith("evt_") else event_id
+    # isdecimal(), not isdigit(): the latter accepts superscripts int() rejects
+    return int(digits) if digits.isdecimal() else None
+
 @dataclass
 class EventFilter:
     """Filter criteria for events"""
@@ -148,7 +174,7 @@ class EventFilter:
     targets: List[str] = None
     priority_min: EventPriority = EventPriority.LOW
     exclude_expired: bool = True
-    since: str = None  # ISO timestamp or event ID
+    since: str = None  # ISO timestamp or event ID (exclusive)
     correlation_id: str = None
     
     def matches(self, event: Event) -> bool:
@@ -166,14 +192,81 @@ class EventFilter:
         if self.correlation_id and event.correlation_id != self.correlation_id:
             return False
         if self.since:
-            if len(self.since) == 36:  # UUID format (event ID)
-                # This would need event ordering logic
-                pass
+            since_seq = parse_event_seq(self.since)
+            if since_seq is not None:  # Event ID
+                if event.seq <= since_seq:
+                    return False
             else:  # ISO timestamp
                 if event.timestamp < self.since:
                     return False
         return True
 
+# ============================================================================
+# Per-connection Event Queue
+# ============================================================================
+
+class RingEventQueue:
+    """
+    Fixed-capacity ring buffer of events feeding a single consumer
+    
+    Producers never block: once the ring is full the oldest undelivered event
+    is overwritten and counted in ``dropped``. The consumer sleeps on an
+    ``asyncio.Event`` that producers set after publishing a slot.
+    
+    Memory ordering: producers and the consumer all run on the event loop
+    thread and there is no ``await`` inside ``put_nowait``/``get_nowait``, so
+    each operation is atomic with respect to the others. A producer writes the
+    slot *before* advancing ``_tail`` and setting ``_ready``, so a consumer
+    that sees ``_head != _tail`` always finds the slot populated; the consumer
+    clears the slot before advancing ``_head`` so the ring holds no stale
+    references to delivered events.
+    """
+    
+    def __init__(self, capacity: int = EventConfig.MAX_QUEUE_SIZE):
+        self._slots: List[Optional[Event]] = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # Monotonic read counter; slot is _head % capacity
+        self._tail = 0  # Monotonic write counter; slot is _tail % capacity
+        self._ready = asyncio.Event()
+        self.dropped = 0
+    
+    def qsize(self) -> int:
+        return self._tail - self._head
+    
+    def empty(self) -> bool:
+        return self._head == self._tail
+    
+    def full(self) -> bool:
+        return self._tail - self._head >= self._capacity
+    
+    def put_nowait(self, event: Event) -> bool:
+        """Publish an event; returns False if the oldest event was overwritten"""
+        overwritten = self.full()
+        if overwritten:
+            self._head += 1
+            self.dropped += 1
+        self._slots[self._tail % self._capacity] = event
+        self._tail += 1
+        self._ready.set()
+        return not overwritten
+    
+    def get_nowait(self) -> Event:
+        """Take the oldest event without waiting"""
+        if self._head == self._tail:
+            raise asyncio.QueueEmpty
+        slot = self._head % self._capacity
+        event = self._slots[slot]
+        self._slots[slot] = None
+        self._head += 1
+        return event
+    
+    async def get(self) -> Event:
+        """Take the oldest event, waiting until one is published"""
+        while self._head == self._tail:
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
+
 # ============================================================================
 # Connection and Subscription Management
 # ============================================================================
@@ -185,7 +278,7 @@ class Connection:
     created_at: datetime
     last_activity: datetime
     subscriptions: Set[str] = field(default_factory=set)
-    queue: asyncio.Queue = None
+    queue: RingEventQueue = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     event_count: int = 0
     rate_limit_window_start: float = field(default_factory=time.time)
@@ -211,6 +304,27 @@ class ConnectionPool:
         self.connections: Dict[str, Connection] = {}
         self._lock = asyncio.Lock()
         self._cleanup_task: asyncio.Task = None
+        # channel -> IDs of the connections subscribed to it
+        self._channel_index: Dict[str, Set[str]] = defaultdict(set)
+    
+    def subscribe(self, conn: Connection, channel: str):
+        """Subscribe a connection to a channel"""
+        conn.subscriptions.add(channel)
+        self._channel_index[channel].add(conn.id)
+    
+    def subscribers(self, channel: str) -> List[str]:
+        """IDs of the connections subscribed to a channel"""
+        return list(self._channel_index.get(channel, ()))
+    
+    def _drop(self, connection_id: str):
+        """Forget a connection and its subscriptions (caller holds the lock)"""
+        conn = self.connections.pop(connection_id)
+        for channel in conn.subscriptions:
+            conn_ids = self._channel_index.get(channel)
+            if conn_ids is not None:
+                conn_ids.discard(connection_id)
+                if not conn_ids:
+                    del self._channel_index[channel]
     
     async def create_connection(self, 
                               connection_id: str = None,
@@ -228,7 +342,7 @@ class ConnectionPool:
                 id=conn_id,
                 created_at=datetime.now(),
                 last_activity=datetime.now(),
-                queue=asyncio.Queue(maxsize=EventConfig.MAX_QUEUE_SIZE),
+                queue=RingEventQueue(EventConfig.MAX_QUEUE_SIZE),
                 metadata=metadata or {}
             )
             self.connections[conn_id] = conn
@@ -247,7 +361,7 @@ class ConnectionPool:
         """Remove a connection"""
         async with self._lock:
             if connection_id in self.connections:
-                del self.connections[connection_id]
+                self._drop(connection_id)
                 logger.info(f"Connection removed: {connection_id}")
     
     async def cleanup_stale_connections(self, max_idle_seconds: int = 600):
@@ -261,7 +375,7 @@ class ConnectionPool:
                     stale.append(conn_id)
             
             for conn_id in stale:
-                del self.connections[conn_id]
+                self._drop(conn_id)
                 logger.info(f"Cleaned up stale connection: {conn_id}")
             
             return len(stale)
@@ -313,10 +427,13 @@ class EventManager:
         if not hasattr(self, 'initialized'):
             self.initialized = True
             self.connection_pool = ConnectionPool()
+            # Ordered by Event.seq, which lets sync_changes stop at the sync point
             self.event_history: deque = deque(maxlen=EventConfig.MAX_EVENT_HISTORY)
+            self._event_seq = itertools.count(1)
             self.event_handlers: Dict[str, List[Callable]] = defaultdict(list)
             self.metrics = EventMetrics()
             self._background_tasks: List[asyncio.Task] = []
+            self._wait_slots = asyncio.Semaphore(EventConfig.MAX_CONCURRENT_WAITS)
             logger.info("EventManager initialized")
     
     async def start(self):
@@ -350,8 +467,10 @@ class EventManager:
         """
         Emit an event to all subscribers with retry logic
         """
+        seq = next(self._event_seq)
         event = Event(
-            id=str(uuid.uuid4()),
+            id=f"evt_{seq}",
+            seq=seq,
             type=event_type,
             source=source,
             target=target,
@@ -369,7 +488,7 @@ class EventManager:
         # Notify subscribers with retry
         await self._distribute_event(event)
         
-        logger.debug(f"Event emitted: {action} on {target} (priority: {priority.name})")
+        logger.debug("Event emitted: %s on %s (priority: %s)", action, target, priority.name)
         return event
     
     async def _distribute_event(self, event: Event):
@@ -381,28 +500,25 @@ class EventManager:
             "*"
         ]
         
-        tasks = []
+        # Only connections subscribed to a matching channel are visited, and
+        # each receives the event once even if several of its channels match
+        recipients: Dict[str, None] = {}
         for channel in channels:
             for conn_id in await self._get_channel_subscribers(channel):
-                task = asyncio.create_task(
-                    self._send_to_connection(conn_id, event)
-                )
-                tasks.append(task)
+                recipients[conn_id] = None
         
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        # Queue puts never block, so deliver inline instead of spawning a
+        # task per subscriber
+        for conn_id in recipients:
+            await self._send_to_connection(conn_id, event)
     
     async def _get_channel_subscribers(self, channel: str) -> List[str]:
         """Get all connections subscribed to a channel"""
-        subscribers = []
         async with self.connection_pool._lock:
-            for conn in self.connection_pool.connections.values():
-                if channel in conn.subscriptions:
-                    subscribers.append(conn.id)
-        return subscribers
+            return self.connection_pool.subscribers(channel)
     
     async def _send_to_connection(self, connection_id: str, event: Event):
-        """Send event to a specific connection with retry"""
+        """Send event to a specific connection"""
         conn = await self.connection_pool.get_connection(connection_id)
         if not conn:
             return
@@ -415,25 +531,14 @@ class EventManager:
         
         conn.increment_rate_limit()
         
-        # Try to send with retries
-        for attempt in range(EventConfig.MAX_RETRY_ATTEMPTS):
-            try:
-                if conn.queue:
-                    await asyncio.wait_for(
-                        conn.queue.put(event),
-                        timeout=1.0
-                    )
-                    conn.event_count += 1
-                    return
-            except asyncio.TimeoutError:
-                if attempt < EventConfig.MAX_RETRY_ATTEMPTS - 1:
-                    await asyncio.sleep(EventConfig.RETRY_DELAY * (attempt + 1))
-                else:
-                    logger.warning(f"Failed to send event to {connection_id} after {EventConfig.MAX_RETRY_ATTEMPTS} attempts")
-                    self.metrics.record_failed_delivery(connection_id)
-            except Exception as e:
-                logger.error(f"Error sending to connection {connection_id}: {e}")
-                break
+        if not conn.queue:
+            return
+        
+        # A full ring overwrites its oldest event rather than stalling the emitter
+        if not conn.queue.put_nowait(event):
+            logger.warning("Queue full for %s, dropped oldest event", connection_id)
+            self.metrics.record_failed_delivery(connection_id)
+        conn.event_count += 1
     
     async def wait_for_updates(self,
                               connection_id: str,
@@ -444,6 +549,9 @@ class EventManager:
         """
         Long-polling wait for updates (used by Claude)
         
+        At most ``EventConfig.MAX_CONCURRENT_WAITS`` calls are parked at
+        once; further callers wait for a slot within their own timeout.
+        
         Returns:
             {
                 "status": "updates" | "timeout" | "error",
@@ -458,6 +566,30 @@ class EventManager:
         # Validate timeout
         timeout = min(timeout, EventConfig.MAX_TIMEOUT)
         
+        try:
+            await asyncio.wait_for(self._wait_slots.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return {
+                "status": "timeout",
+                "events": [],
+                "summary": {},
+                "duration": time.time() - start_time
+            }
+        
+        try:
+            remaining = timeout - (time.time() - start_time)
+            return await self._wait_for_updates(connection_id, targets, remaining, filters, since, start_time)
+        finally:
+            self._wait_slots.release()
+    
+    async def _wait_for_updates(self,
+                               connection_id: str,
+                               targets: List[str],
+                               timeout: float,
+                               filters: EventFilter,
+                               since: str,
+                               start_time: float) -> Dict[str, Any]:
+        """Body of wait_for_updates, run while holding a wait slot"""
         # Create or get connection
         conn = await self.connection_pool.get_connection(connection_id)
         if not conn:
@@ -472,7 +604,7 @@ class EventManager:
             channels = ["*"]
         
         for channel in channels:
-            conn.subscriptions.add(channel)
+            self.connection_pool.subscribe(conn, channel)
         
         # Create filter
         if not filters:
@@ -560,13 +692,16 @@ class EventManager:
         """Get all changes since last sync point"""
         events = []
         
-        # Find events after last_sync_id
-        found_sync_point = last_sync_id is None
-        for event in self.event_history:
-            if found_sync_point and not event.is_expired():
-                events.append(event)
-            elif event.id == last_sync_id:
-                found_sync_point = True
+        # Event IDs are monotonic, so walk back from the newest event only as
+        # far as the sync point: O(changes) rather than O(history)
+        since_seq = 0 if last_sync_id is None else parse_event_seq(last_sync_id)
+        if since_seq is not None:
+            for event in reversed(self.event_history):
+                if event.seq <= since_seq:
+                    break
+                if not event.is_expired():
+                    events.append(event)
+            events.reverse()
         
         result = {
             "events": [e.to_dict() for e in events],
@@ -584,6 +719,10 @@ class EventManager:
         
         return result
     
+    def last_event_id(self) -> Optional[str]:
+        """ID of the most recently emitted event still in the history"""
+        return self.event_history[-1].id if self.event_history else None
+    
     def register_handler(self, pattern: str, handler: Callable, priority: int = 0):
         """Register an event handler with priority"""
         self.event_handlers[pattern].append((priority, handler))
@@ -817,6 +956,8 @@ __all__ = [
     'EventPriority',
     'EventFilter',
     'EventConfig',
+    'RingEventQueue',
+    'parse_event_seq',
     'emit_event',
     'event_session',
     'event_manager',
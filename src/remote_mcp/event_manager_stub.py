@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+No-op stand-in for the event manager
+Used when the real event system cannot be imported, so tools can be
+decorated identically whether or not events are available
+"""
+
+from enum import Enum
+
+# ============================================================================
+# Event Types
+# ============================================================================
+
+class EventType(Enum):
+    """Standard event types for MCP-UI communication"""
+    # Data events
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+    READ = "read"
+    LIST = "list"
+    BATCH = "batch"
+
+    # Navigation events
+    NAVIGATE = "navigate"
+    REFRESH = "refresh"
+    FOCUS = "focus"
+
+    # System events
+    CONNECT = "connect"
+    DISCONNECT = "disconnect"
+    HEARTBEAT = "heartbeat"
+    ERROR = "error"
+    SUCCESS = "success"
+    WARNING = "warning"
+
+    # Sync events
+    SYNC_START = "sync_start"
+    SYNC_END = "sync_end"
+    CONFLICT = "conflict"
+
+    # Custom events
+    CUSTOM = "custom"
+
+class EventPriority(Enum):
+    """Event priority levels"""
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+    CRITICAL = 3
+
+# ============================================================================
+# No-op Event System
+# ============================================================================
+
+# No event system: callers check for None before long-polling or syncing
+event_manager = None
+EventFilter = None
+
+def emit_event(event_type: EventType = EventType.CUSTOM,
+               target: str = None,
+               extract_id=None,
+               ui_hint: str = None,
+               priority: EventPriority = EventPriority.NORMAL):
+    """Decorator matching event_manager.emit_event that returns the function unchanged"""
+    def decorator(func):
+        return func
+    return decorator
+
+__all__ = [
+    'EventType',
+    'EventPriority',
+    'EventFilter',
+    'emit_event',
+    'event_manager'
+]
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Starlette response classes shared by the MCP and web servers
+"""
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+__all__ = [
+    'ORJSONResponse'
+]
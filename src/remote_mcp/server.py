@@ -7,15 +7,22 @@ Production-ready with event-driven collaboration
 import os
 import asyncio
 import logging
-import json
+import operator
+import re
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
 from fastmcp import FastMCP
 from starlette.applications import Starlette
 from starlette.routing import Route
-from starlette.responses import JSONResponse
 import uvicorn
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows
+    uvloop = None
+
 # Import event system
 try:
     from .event_manager import (
@@ -27,11 +34,29 @@ try:
     )
 except ImportError:
     # If running standalone, event system may not be available
-    event_manager = None
-    EventType = None
-    EventPriority = None
-    emit_event = lambda *args, **kwargs: lambda func: func
-    EventFilter = None
+    from .event_manager_stub import (
+        event_manager,
+        EventType,
+        EventPriority,
+        emit_event,
+        EventFilter
+    )
+
+# Import storage
+from .store import NotesStore, TasksStore
+from .responses import ORJSONResponse
+
+# Event loop implementation handed to uvicorn; never "auto", which can
+# silently fall back to the pure-Python asyncio loop
+UVICORN_LOOP = "uvloop" if uvloop else "asyncio"
+
+# Read-only priority name lookup for wait_for_updates, resolved once at import
+_PRIORITY_MAP = MappingProxyType({
+    "low": EventPriority.LOW,
+    "normal": EventPriority.NORMAL,
+    "high": EventPriority.HIGH,
+    "critical": EventPriority.CRITICAL
+})
 
 # Configure logging
 logging.basicConfig(
@@ -45,12 +70,22 @@ mcp = FastMCP("Notes MCP")
 mcp.description = "A Remote MCP note taking app"
 
 # Simple task database
-tasks_db = {}
-task_counter = 0
+tasks_db = TasksStore()
 
 # Simple notes database
-notes_db = {}
-note_counter = 0
+notes_db = NotesStore()
+
+# Full-state snapshot served by sync_changes, keyed on the store versions.
+# The state dict is replaced wholesale (never mutated) when a store changes.
+_state_snapshot: Dict[str, Any] = {"version": None, "state": None, "event_id": None}
+
+# ============================================================================
+# UTILITIES
+# ============================================================================
+
+def _now_iso() -> str:
+    """Current local time as an ISO string; call once per operation and reuse"""
+    return datetime.now().isoformat()
 
 # ============================================================================
 # SYSTEM INFO
@@ -62,7 +97,7 @@ async def system_info() -> Dict[str, Any]:
     return {
         "server_name": "Atlas Remote MCP Prototype",
         "version": "2.0.0",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "transport": "streamable-http",
         "features": ["calculator", "text_processing", "task_management", "notes_management"]
     }
@@ -71,6 +106,23 @@ async def system_info() -> Dict[str, Any]:
 # CALCULATOR TOOLS
 # ============================================================================
 
+def _safe_div(x: float, y: float) -> float:
+    return x / y if y != 0 else float('inf')
+
+def _safe_mod(x: float, y: float) -> Optional[float]:
+    return x % y if y != 0 else None
+
+# Operation table built once at import
+_CALC_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": _safe_div,
+    "power": operator.pow,
+    "modulo": _safe_mod
+}
+_VALID_OPS = tuple(_CALC_OPS)
+
 @mcp.tool()
 async def calculate(
     a: float,
@@ -85,45 +137,42 @@ async def calculate(
         b: Second number
         operation: One of add, subtract, multiply, divide, power, modulo
     """
-    operations = {
-        "add": lambda x, y: x + y,
-        "subtract": lambda x, y: x - y,
-        "multiply": lambda x, y: x * y,
-        "divide": lambda x, y: x / y if y != 0 else float('inf'),
-        "power": lambda x, y: x ** y,
-        "modulo": lambda x, y: x % y if y != 0 else None
-    }
-    
-    if operation in operations:
-        result = operations[operation](a, b)
-        return {
-            "operation": operation,
-            "a": a,
-            "b": b,
-            "result": result,
-            "expression": f"{a} {operation} {b} = {result}"
-        }
-    else:
+    op = _CALC_OPS.get(operation)
+    if op is None:
         return {
             "error": f"Unknown operation: {operation}",
-            "valid_operations": list(operations.keys())
+            "valid_operations": list(_VALID_OPS)
         }
+    
+    result = op(a, b)
+    return {
+        "operation": operation,
+        "a": a,
+        "b": b,
+        "result": result,
+        "expression": f"{a} {operation} {b} = {result}"
+    }
 
 # ============================================================================
 # TEXT ANALYSIS
 # ============================================================================
 
+# One match per non-blank '.'-separated segment: starts at the segment's first
+# non-space character and runs to the next '.'
+_SENTENCE_RE = re.compile(r"[^\s.][^.]*")
+
 @mcp.tool()
 async def text_analyze(text: str) -> Dict[str, Any]:
     """Analyze text and return statistics"""
     words = text.split()
-    sentences = text.split('.')
+    word_count = len(words)
+    sentence_count = sum(1 for _ in _SENTENCE_RE.finditer(text))
     
     return {
         "character_count": len(text),
-        "word_count": len(words),
-        "sentence_count": len([s for s in sentences if s.strip()]),
-        "average_word_length": sum(len(word) for word in words) / len(words) if words else 0,
+        "word_count": word_count,
+        "sentence_count": sentence_count,
+        "average_word_length": sum(map(len, words)) / word_count if words else 0,
         "unique_words": len(set(words)),
         "preview": text[:100] + "..." if len(text) > 100 else text
     }
@@ -170,13 +219,7 @@ async def wait_for_updates(
         }
     
     # Convert priority string to enum
-    priority_map = {
-        "low": EventPriority.LOW if EventPriority else 0,
-        "normal": EventPriority.NORMAL if EventPriority else 1,
-        "high": EventPriority.HIGH if EventPriority else 2,
-        "critical": EventPriority.CRITICAL if EventPriority else 3
-    }
-    priority = priority_map.get(priority_min, 1)
+    priority = _PRIORITY_MAP.get(priority_min, _PRIORITY_MAP["normal"])
     
     # Create filter if event system is available
     filter_obj = None
@@ -196,9 +239,24 @@ async def wait_for_updates(
         since=since
     )
     
-    logger.info(f"Claude wait_for_updates: {result['status']} with {len(result.get('events', []))} events")
+    # Logged on every long-poll completion, so skip building the arguments when filtered
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Claude wait_for_updates: %s with %d events", result['status'], len(result.get('events', [])))
     return result
 
+def _full_state() -> Dict[str, Any]:
+    """Current notes/tasks state, rebuilt only after a write"""
+    version = (notes_db.version, tasks_db.version)
+    if _state_snapshot["version"] != version:
+        _state_snapshot["state"] = {
+            "notes": notes_db.records(),
+            "tasks": tasks_db.records()
+        }
+        # Watermark: the snapshot reflects every change up to this event
+        _state_snapshot["event_id"] = event_manager.last_event_id() if event_manager else None
+        _state_snapshot["version"] = version
+    return _state_snapshot
+
 @mcp.tool()
 async def sync_changes(
     last_sync_id: str = None,
@@ -216,7 +274,8 @@ async def sync_changes(
         {
             "events": [...],  # Changes since last sync
             "next_sync_id": "evt_456",  # Use for next sync
-            "state": {...}  # Current state (if requested)
+            "state": {...},  # Current state (if requested)
+            "state_event_id": "evt_450"  # Last event reflected in state
         }
     """
     if not event_manager:
@@ -234,10 +293,9 @@ async def sync_changes(
     
     # If full state requested, add current data
     if include_full_state:
-        result["state"] = {
-            "notes": list(notes_db.values()),
-            "tasks": list(tasks_db.values())
-        }
+        snapshot = _full_state()
+        result["state"] = snapshot["state"]
+        result["state_event_id"] = snapshot["event_id"]
     
     return result
 
@@ -259,10 +317,8 @@ async def task_create(
         description: Task description
         priority: One of low, medium, high
     """
-    global task_counter, tasks_db
-    
-    task_counter += 1
-    task_id = f"task_{task_counter}"
+    task_id = f"task_{tasks_db.next_seq()}"
+    now = _now_iso()
     
     task = {
         "id": task_id,
@@ -270,12 +326,12 @@ async def task_create(
         "description": description,
         "priority": priority,
         "status": "pending",
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat()
+        "created_at": now,
+        "updated_at": now
     }
     
     tasks_db[task_id] = task
-    logger.info(f"Created task: {task_id}")
+    logger.debug("Created task: %s", task_id)
     return task
 
 @mcp.tool()
@@ -288,10 +344,7 @@ async def task_list(
     Args:
         status: Optional filter - pending, in_progress, or completed
     """
-    tasks = list(tasks_db.values())
-    if status:
-        tasks = [t for t in tasks if t.get("status") == status]
-    return tasks
+    return tasks_db.find(status)
 
 @mcp.tool()
 async def task_update(
@@ -311,23 +364,22 @@ async def task_update(
         description: New description
         priority: New priority
     """
-    if task_id not in tasks_db:
-        return {"error": f"Task {task_id} not found"}
-    
-    task = tasks_db[task_id]
-    
+    changes = {}
     if status:
-        task["status"] = status
+        changes["status"] = status
     if title:
-        task["title"] = title
+        changes["title"] = title
     if description:
-        task["description"] = description
+        changes["description"] = description
     if priority:
-        task["priority"] = priority
+        changes["priority"] = priority
     
-    task["updated_at"] = datetime.now().isoformat()
+    try:
+        task = tasks_db.update(task_id, updated_at=_now_iso(), **changes)
+    except KeyError:
+        return {"error": f"Task {task_id} not found"}
     
-    logger.info(f"Updated task: {task_id}")
+    logger.debug("Updated task: %s", task_id)
     return task
 
 @mcp.tool()
@@ -338,11 +390,11 @@ async def task_delete(task_id: str) -> Dict[str, Any]:
     Args:
         task_id: Task ID to delete
     """
-    if task_id not in tasks_db:
+    try:
+        del tasks_db[task_id]
+    except KeyError:
         return {"error": f"Task {task_id} not found"}
-    
-    del tasks_db[task_id]
-    logger.info(f"Deleted task: {task_id}")
+    logger.debug("Deleted task: %s", task_id)
     return {"success": True, "message": f"Task {task_id} deleted"}
 
 # ============================================================================
@@ -350,7 +402,7 @@ async def task_delete(task_id: str) -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
-@emit_event(EventType.LIST if EventType else None, target="note")
+@emit_event(EventType.LIST, target="note")
 async def list_notes(tags: List[str] = None) -> Dict[str, Any]:
     """
     Lists all notes, or search notes with tags
@@ -358,22 +410,11 @@ async def list_notes(tags: List[str] = None) -> Dict[str, Any]:
     Args:
         tags: Optional tags to filter notes
     """
-    notes = list(notes_db.values())
-    
-    # Filter by tags if provided
-    if tags:
-        notes = [n for n in notes if any(tag in n.get("tags", []) for tag in tags)]
-    
-    # Return simplified list for overview
-    simplified_notes = [{
-        "id": n["id"],
-        "title": n["title"],
-        "summary": n["summary"],
-        "tags": n["tags"]
-    } for n in notes]
+    # Simplified list for overview, filtered through the tag index
+    simplified_notes = notes_db.summaries(tags)
     
     return {
-        "count": len(notes),
+        "count": len(simplified_notes),
         "notes": simplified_notes
     }
 
@@ -385,13 +426,14 @@ async def get_note(note_id: str) -> Dict[str, Any]:
     Args:
         note_id: ID of the note to retrieve
     """
-    if note_id not in notes_db:
+    note = notes_db.get(note_id)
+    if note is None:
         return {"error": f"Note with ID '{note_id}' not found"}
     
-    return notes_db[note_id]
+    return note
 
 @mcp.tool()
-@emit_event(EventType.CREATE if EventType else None, target="note", ui_hint="navigate_to", priority=EventPriority.HIGH if EventPriority else 2)
+@emit_event(EventType.CREATE, target="note", ui_hint="navigate_to", priority=EventPriority.HIGH)
 async def write_note(
     title: str,
     content: str,
@@ -409,30 +451,25 @@ async def write_note(
         tags: Tags for the note
         note_id: Optional ID for updating existing note
     """
-    global note_counter, notes_db
-    
     if not note_id:
-        # Create new note ID
-        note_counter += 1
-        # Generate ID similar to MCPNotes format
-        base_id = title.lower().replace(" ", "-")[:30]
-        note_id = f"{base_id}-{note_counter}"
+        note_id = notes_db.new_id(title)
     
+    now = _now_iso()
     note = {
         "id": note_id,
         "title": title,
         "summary": summary,
         "tags": tags or [],
         "content": content,
-        "created_at": notes_db.get(note_id, {}).get("created_at", datetime.now().isoformat()),
-        "updated_at": datetime.now().isoformat()
+        "created_at": notes_db.field(note_id, "created_at", now),
+        "updated_at": now
     }
     
     is_update = note_id in notes_db
     notes_db[note_id] = note
     
     action = "updated" if is_update else "created"
-    logger.info(f"{action.capitalize()} note: {note_id}")
+    logger.debug("%s note: %s", action.capitalize(), note_id)
     
     return {
         "success": True,
@@ -441,7 +478,7 @@ async def write_note(
     }
 
 @mcp.tool()
-@emit_event(EventType.DELETE if EventType else None, target="note", priority=EventPriority.HIGH if EventPriority else 2)
+@emit_event(EventType.DELETE, target="note", priority=EventPriority.HIGH)
 async def delete_note(note_id: str) -> Dict[str, Any]:
     """
     Deletes a specific note by its ID
@@ -449,11 +486,11 @@ async def delete_note(note_id: str) -> Dict[str, Any]:
     Args:
         note_id: ID of the note to delete
     """
-    if note_id not in notes_db:
+    try:
+        del notes_db[note_id]
+    except KeyError:
         return {"error": f"Note with ID '{note_id}' not found"}
-    
-    del notes_db[note_id]
-    logger.info(f"Deleted note: {note_id}")
+    logger.debug("Deleted note: %s", note_id)
     return {"success": True, "message": f"Note with ID '{note_id}' has been deleted"}
 
 # ============================================================================
@@ -468,12 +505,12 @@ async def get_note_resource(note_id: str) -> str:
     Args:
         note_id: Note identifier
     """
-    if note_id not in notes_db:
+    # Return note as formatted JSON string, cached until the note changes
+    rendered = notes_db.to_json(note_id)
+    if rendered is None:
         return f"Note not found: {note_id}"
     
-    note = notes_db[note_id]
-    # Return note as formatted JSON string
-    return json.dumps(note, indent=2)
+    return rendered
 
 # ============================================================================
 # ASGI APPLICATION WITH HEALTH CHECK
@@ -481,7 +518,7 @@ async def get_note_resource(note_id: str) -> str:
 
 async def health_check(request):
     """Health check endpoint for CapRover"""
-    return JSONResponse(
+    return ORJSONResponse(
         {"status": "healthy", "service": "Atlas Remote MCP", "version": "2.0.0"},
         status_code=200
     )
@@ -498,7 +535,7 @@ try:
         raise AttributeError("No HTTP app method found in FastMCP")
     
 except Exception as e:
-    logger.error(f"Failed to create MCP HTTP app: {e}")
+    logger.error("Failed to create MCP HTTP app: %s", e)
     raise
 
 # Export the raw MCP app for unified server to access lifespan
@@ -527,10 +564,11 @@ if __name__ == "__main__":
     # Get configuration from environment
     port = int(os.environ.get("PORT", 8000))
     host = os.environ.get("HOST", "0.0.0.0")
+    log_level = os.environ.get("LOG_LEVEL", "info").lower()
     
-    logger.info(f"Starting Atlas Remote MCP Server v2.0.0")
-    logger.info(f"Server will be available at {host}:{port}/mcp")
-    logger.info(f"Health check at {host}:{port}/health (if supported by FastMCP)")
+    logger.info("Starting Atlas Remote MCP Server v2.0.0")
+    logger.info("Server will be available at %s:%s/mcp", host, port)
+    logger.info("Health check at %s:%s/health (if supported by FastMCP)", host, port)
     
 
     # FastMCP's StreamableHTTPSessionManager task group was not initialized. 
@@ -541,10 +579,10 @@ if __name__ == "__main__":
 
     try:
         # Run the HTTP server directly with the standalone app
-        uvicorn.run(standalone_app, host=host, port=port)
+        uvicorn.run(standalone_app, host=host, port=port, loop=UVICORN_LOOP, http="httptools", log_level=log_level)
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
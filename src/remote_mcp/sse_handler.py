@@ -8,7 +8,7 @@ import asyncio
 import json
 import logging
 import uuid
-from typing import Optional, Dict, Any, AsyncGenerator
+from typing import Optional, Dict, Any, AsyncGenerator, Union
 from datetime import datetime
 from starlette.responses import StreamingResponse
 from starlette.requests import Request
@@ -87,7 +87,7 @@ class SSEMessage:
 async def create_sse_stream(request: Request,
                            connection_id: str = None,
                            channels: list = None,
-                           heartbeat_interval: int = 30) -> AsyncGenerator[str, None]:
+                           heartbeat_interval: int = 30) -> AsyncGenerator[Union[str, bytes], None]:
     """
     Create an SSE stream for a client
     
@@ -121,7 +121,7 @@ async def create_sse_stream(request: Request,
         
         # Subscribe to channels
         for channel in channels:
-            conn.subscriptions.add(channel)
+            event_manager.connection_pool.subscribe(conn, channel)
         
         # Send initial connection event
         yield SSEMessage.format(
@@ -158,12 +158,8 @@ async def create_sse_stream(request: Request,
                         timeout=heartbeat_interval
                     )
                     
-                    # Format and send event
-                    yield SSEMessage.format(
-                        data=event.to_dict(),
-                        event=event.type.value,
-                        id=event.id
-                    )
+                    # Send the event's shared, pre-encoded frame
+                    yield event.sse_frame
                     
                 except asyncio.TimeoutError:
                     # Send heartbeat
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+In-memory storage for notes and tasks
+Struct-of-arrays layout with secondary indexes for filtered listings
+"""
+
+import itertools
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Set
+
+import orjson
+
+# Title -> note ID slug mapping, applied in a single translate() pass
+_SLUG_TABLE = str.maketrans({" ": "-"})
+_SLUG_LENGTH = 30
+
+# ============================================================================
+# Generic Column Store
+# ============================================================================
+
+class ColumnStore:
+    """
+    Record store keeping one list per field (struct of arrays)
+
+    Rows are addressed by a positional index resolved through ``_id_to_idx``.
+    One field (``INDEXED``) is mirrored into a secondary index mapping each
+    key to the set of row indexes filed under it, so filtered queries cost
+    O(result) instead of a full scan. Each row's index keys are frozen once
+    at write time (``_keys``), so a rewrite only touches the index entries
+    whose keys actually changed. Each row also carries its insertion rank
+    (``_pos``), so index hits can be returned in insertion order even
+    after deletes have swap-moved rows around.
+
+    The mapping protocol (``in``, ``[]``, ``del``, ``get``, ``values``) is
+    supported and materializes plain dicts, so callers that treat the store
+    as a ``Dict[str, Dict]`` keep working.
+
+    Pretty-printed JSON renderings are cached per record and dropped on any
+    write to that record.
+
+    ``next_seq()`` hands out the sequence numbers used to build new record
+    IDs; ``clear()`` restarts it. ``version`` increases on every write, so
+    readers can cache derived views and rebuild them only when it moves.
+    """
+
+    FIELDS: tuple = ("id",)
+    INDEXED: str = None
+
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.FIELDS}
+        self._id_to_idx: Dict[str, int] = {}
+        self._index: Dict[Any, Set[int]] = defaultdict(set)
+        self._keys: List[frozenset] = []
+        self._pos: List[int] = []
+        self._order = itertools.count()
+        self._json: Dict[str, str] = {}
+        self._seq = itertools.count(1)
+        self.version = 0
+
+    def next_seq(self) -> int:
+        """Next number in this store's ID sequence"""
+        return next(self._seq)
+
+    def _index_keys(self, value: Any) -> Iterable:
+        """Keys under which a value of the indexed field is filed"""
+        return (value,)
+
+    # ------------------------------------------------------------------------
+    # Secondary index maintenance
+    # ------------------------------------------------------------------------
+
+    def _discard(self, key: Any, idx: int):
+        """Drop row ``idx`` from one index entry, pruning it once empty"""
+        rows = self._index.get(key)
+        if rows is not None:
+            rows.discard(idx)
+            if not rows:
+                del self._index[key]
+
+    def _refile(self, idx: int):
+        """Bring the index in line with row ``idx``'s current indexed value"""
+        keys = frozenset(self._index_keys(self.columns[self.INDEXED][idx]))
+        old = self._keys[idx]
+        for key in old - keys:
+            self._discard(key, idx)
+        for key in keys - old:
+            self._index[key].add(idx)
+        self._keys[idx] = keys
+
+    # ------------------------------------------------------------------------
+    # Row access
+    # ------------------------------------------------------------------------
+
+    def _row(self, idx: int) -> Dict[str, Any]:
+        """Materialize row ``idx`` as a dict"""
+        return {name: column[idx] for name, column in self.columns.items()}
+
+    def field(self, record_id: str, name: str, default: Any = None) -> Any:
+        """Read a single field without materializing the record"""
+        idx = self._id_to_idx.get(record_id)
+        if idx is None:
+            return default
+        return self.columns[name][idx]
+
+    def records(self, rows: Iterable[int] = None) -> List[Dict[str, Any]]:
+        """
+        Materialize rows straight into a list of dicts
+
+        Args:
+            rows: Row indexes to include; defaults to every record in insertion order
+        """
+        items = tuple(self.columns.items())
+        if rows is None:
+            rows = self._id_to_idx.values()
+        return [{name: column[i] for name, column in items} for i in rows]
+
+    def lookup(self, keys: Iterable) -> List[int]:
+        """Row indexes filed under any of ``keys`` (OR semantics), in insertion order"""
+        matched: Set[int] = set()
+        for key in frozenset(keys):
+            rows = self._index.get(key)
+            if rows:
+                matched |= rows
+        return sorted(matched, key=self._pos.__getitem__)
+
+    def to_json(self, record_id: str) -> Optional[str]:
+        """Record as indented JSON, rendered once until it next changes"""
+        rendered = self._json.get(record_id)
+        if rendered is None:
+            idx = self._id_to_idx.get(record_id)
+            if idx is None:
+                return None
+            rendered = orjson.dumps(self._row(idx), option=orjson.OPT_INDENT_2).decode()
+            self._json[record_id] = rendered
+        return rendered
+
+    def update(self, record_id: str, **fields) -> Dict[str, Any]:
+        """Overwrite selected fields of an existing record and return it"""
+        idx = self._id_to_idx[record_id]
+        self._json.pop(record_id, None)
+        self.version += 1
+        for name, value in fields.items():
+            self.columns[name][idx] = value
+        if self.INDEXED in fields:
+            self._refile(idx)
+        return self._row(idx)
+
+    # ------------------------------------------------------------------------
+    # Mapping protocol
+    # ------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._id_to_idx)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._id_to_idx
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._id_to_idx)
+
+    def __getitem__(self, record_id: str) -> Dict[str, Any]:
+        return self._row(self._id_to_idx[record_id])
+
+    def get(self, record_id: str, default: Any = None) -> Optional[Dict[str, Any]]:
+        idx = self._id_to_idx.get(record_id)
+        if idx is None:
+            return default
+        return self._row(idx)
+
+    def pop(self, record_id: str, default: Any = None) -> Optional[Dict[str, Any]]:
+        """Remove a record and return it, or ``default`` if it does not exist"""
+        idx = self._id_to_idx.get(record_id)
+        if idx is None:
+            return default
+        record = self._row(idx)
+        del self[record_id]
+        return record
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        """Iterate records in insertion order"""
+        return (self._row(idx) for idx in self._id_to_idx.values())
+
+    def __setitem__(self, record_id: str, record: Dict[str, Any]):
+        self._json.pop(record_id, None)
+        self.version += 1
+        idx = self._id_to_idx.get(record_id)
+        if idx is None:
+            idx = len(self._id_to_idx)
+            self._id_to_idx[record_id] = idx
+            for name, column in self.columns.items():
+                column.append(record.get(name))
+            self._keys.append(frozenset())
+            self._pos.append(next(self._order))
+        else:
+            for name, column in self.columns.items():
+                column[idx] = record.get(name)
+        self.columns["id"][idx] = record_id
+        self._refile(idx)
+
+    def __delitem__(self, record_id: str):
+        idx = self._id_to_idx.pop(record_id)
+        self._json.pop(record_id, None)
+        self.version += 1
+        for key in self._keys[idx]:
+            self._discard(key, idx)
+
+        # Swap-remove: move the last row into the hole so columns stay dense
+        last = len(self._id_to_idx)
+        if idx != last:
+            for column in self.columns.values():
+                column[idx] = column[last]
+            self._pos[idx] = self._pos[last]
+            keys = self._keys[idx] = self._keys[last]
+            for key in keys:
+                rows = self._index[key]
+                rows.discard(last)
+                rows.add(idx)
+            self._id_to_idx[self.columns["id"][idx]] = idx
+        for column in self.columns.values():
+            column.pop()
+        self._keys.pop()
+        self._pos.pop()
+
+    def clear(self):
+        for column in self.columns.values():
+            column.clear()
+        self._id_to_idx.clear()
+        self._index.clear()
+        self._keys.clear()
+        self._pos.clear()
+        self._order = itertools.count()
+        self._json.clear()
+        self._seq = itertools.count(1)
+        self.version += 1
+
+# ============================================================================
+# Notes and Tasks
+# ============================================================================
+
+class NotesStore(ColumnStore):
+    """Notes indexed by tag"""
+
+    FIELDS = ("id", "title", "summary", "tags", "content", "created_at", "updated_at")
+    INDEXED = "tags"
+
+    def new_id(self, title: str) -> str:
+        """Generate a note ID from its title, similar to the MCPNotes format"""
+        # Lower only the prefix that survives truncation; the final slice
+        # guards against characters whose lowercase form is longer
+        slug = title[:_SLUG_LENGTH].lower().translate(_SLUG_TABLE)[:_SLUG_LENGTH]
+        return f"{slug}-{self.next_seq()}"
+
+    def _index_keys(self, tags: Optional[List[str]]) -> Iterable:
+        return tags or ()
+
+    def summaries(self, tags: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Project id/title/summary/tags straight from the columns
+
+        Args:
+            tags: Only include notes carrying any of these tags
+        """
+        columns = self.columns
+        ids, titles, summaries, tags_list = columns["id"], columns["title"], columns["summary"], columns["tags"]
+        rows = self.lookup(tags) if tags else self._id_to_idx.values()
+        return [{
+            "id": ids[i],
+            "title": titles[i],
+            "summary": summaries[i],
+            "tags": tags_list[i]
+        } for i in rows]
+
+class TasksStore(ColumnStore):
+    """Tasks indexed by status"""
+
+    FIELDS = ("id", "title", "description", "priority", "status", "created_at", "updated_at")
+    INDEXED = "status"
+
+    def find(self, status: str = None) -> List[Dict[str, Any]]:
+        """
+        List tasks, optionally restricted to one status
+
+        Args:
+            status: Only include tasks in this status
+        """
+        return self.records(self.lookup((status,)) if status else None)
+
+__all__ = [
+    'ColumnStore',
+    'NotesStore',
+    'TasksStore'
+]
@@ -10,13 +10,29 @@ import os
 from contextlib import asynccontextmanager
 from starlette.applications import Starlette
 from starlette.routing import Route, Mount
-from starlette.responses import JSONResponse, RedirectResponse, HTMLResponse
+from starlette.responses import RedirectResponse, HTMLResponse
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 import uvicorn
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows
+    uvloop = None
+
 # Import event system first
 from .event_manager import event_manager
+from .responses import ORJSONResponse
+
+# Install uvloop before any loop is created so the background tasks
+# started in unified_lifespan run on it as well
+if uvloop:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Event loop implementation handed to uvicorn; never "auto", which can
+# silently fall back to the pure-Python asyncio loop
+UVICORN_LOOP = "uvloop" if uvloop else "asyncio"
 
 # Configure logging
 logging.basicConfig(
@@ -87,7 +103,7 @@ async def health_check(request):
     
     # Return appropriate status code
     status_code = 200 if health_status["status"] == "healthy" else 503
-    return JSONResponse(health_status, status_code=status_code)
+    return ORJSONResponse(health_status, status_code=status_code)
 
 async def root_redirect(request):
     """Redirect root to web UI"""
@@ -115,8 +131,7 @@ async def handle_mcp_endpoint(request):
         return await mcp_app(request.scope, request.receive, request._send)
     else:
         # If not callable, return error
-        from starlette.responses import JSONResponse
-        return JSONResponse({"error": "MCP endpoint not available"}, status_code=503)
+        return ORJSONResponse({"error": "MCP endpoint not available"}, status_code=503)
 
 # ============================================================================
 # Create Unified Application
@@ -187,6 +202,10 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
     host = os.environ.get("HOST", "0.0.0.0")
     reload = os.environ.get("RELOAD", "").lower() == "true"
+    # Use "warning" in production to silence per-request access logs
+    log_level = os.environ.get("LOG_LEVEL", "info").lower()
+    # Worker processes sharing the listening socket; state is per-process
+    workers = int(os.environ.get("WORKERS", 1))
     
     logger.info("=" * 60)
     logger.info("Unified Server v2 - Real-time Collaboration")
@@ -205,13 +224,23 @@ if __name__ == "__main__":
     logger.info("- Bidirectional collaboration")
     logger.info("=" * 60)
     
+    if workers > 1:
+        logger.warning(
+            "Running %d workers: notes, tasks and events are kept in memory per worker, "
+            "so clients must be pinned to one worker (sticky sessions)", workers
+        )
+    
     try:
         uvicorn.run(
-            unified_app,
+            # Multiple workers need an import string so each process can load the app
+            "remote_mcp.unified_server:app" if workers > 1 else unified_app,
             host=host,
             port=port,
             reload=reload,
-            log_level="info"
+            workers=workers,
+            loop=UVICORN_LOOP,
+            http="httptools",
+            log_level=log_level
         )
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
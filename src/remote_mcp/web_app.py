@@ -18,7 +18,7 @@ from starlette.middleware.cors import CORSMiddleware
 import uvicorn
 
 # Import shared notes database from server
-from .server import notes_db, note_counter
+from .server import notes_db
 
 # Import event system
 from .event_manager import (
@@ -28,6 +28,9 @@ from .event_manager import (
     emit_event
 )
 
+# orjson-backed JSON responses
+from .responses import ORJSONResponse
+
 # Import SSE handler
 from .sse_handler import sse_endpoint, SSE_CLIENT_JS
 
@@ -57,21 +60,17 @@ def escape_html(text: str) -> str:
 
 async def get_all_notes() -> List[Dict[str, Any]]:
     """Get all notes from the database"""
-    return list(notes_db.values())
+    return notes_db.records()
 
 async def create_or_update_note(note: Dict[str, Any]) -> Dict[str, Any]:
     """Create or update a note with event emission"""
-    global note_counter
-    
     note_id = note.get("id")
     is_update = note_id and note_id in notes_db
     
     if not note_id or note_id not in notes_db:
         # Create new note - ensure unique ID
         if not note_id:
-            note_counter += 1
-            base_id = note["title"].lower().replace(" ", "-")[:30]
-            note_id = f"{base_id}-{note_counter}"
+            note_id = notes_db.new_id(note["title"])
         note["id"] = note_id
         note["created_at"] = datetime.now().isoformat()
     
@@ -100,10 +99,8 @@ async def create_or_update_note(note: Dict[str, Any]) -> Dict[str, Any]:
 
 async def delete_note(note_id: str) -> bool:
     """Delete a note by ID with event emission"""
-    if note_id in notes_db:
-        note = notes_db[note_id]
-        del notes_db[note_id]
-        
+    note = notes_db.pop(note_id, None)
+    if note is not None:
         # Emit delete event
         await event_manager.emit(
             event_type=EventType.DELETE,
@@ -469,17 +466,17 @@ async def delete_note_handler(request: Request) -> JSONResponse:
     try:
         note_id = request.path_params.get("id")
         if not note_id:
-            return JSONResponse({"error": "Note ID required"}, status_code=400)
+            return ORJSONResponse({"error": "Note ID required"}, status_code=400)
         
         deleted = await delete_note(note_id)
         if deleted:
-            return JSONResponse({"status": "Deleted"})
+            return ORJSONResponse({"status": "Deleted"})
         else:
-            return JSONResponse({"error": "Note not found"}, status_code=404)
+            return ORJSONResponse({"error": "Note not found"}, status_code=404)
             
     except Exception as e:
         logger.error(f"Error deleting note: {e}")
-        return JSONResponse({"error": "Internal Server Error"}, status_code=500)
+        return ORJSONResponse({"error": "Internal Server Error"}, status_code=500)
 
 # ============================================================================
 # API Endpoints for Real-time Features
@@ -488,14 +485,15 @@ async def delete_note_handler(request: Request) -> JSONResponse:
 async def get_notes_api(request: Request) -> JSONResponse:
     """API endpoint to get all notes"""
     notes = await get_all_notes()
-    return JSONResponse({"notes": notes})
+    return ORJSONResponse({"notes": notes})
 
 async def get_note_api(request: Request) -> JSONResponse:
     """API endpoint to get a specific note"""
     note_id = request.path_params.get("id")
-    if note_id in notes_db:
-        return JSONResponse(notes_db[note_id])
-    return JSONResponse({"error": "Note not found"}, status_code=404)
+    note = notes_db.get(note_id)
+    if note is not None:
+        return ORJSONResponse(note)
+    return ORJSONResponse({"error": "Note not found"}, status_code=404)
 
 # ============================================================================
 # Routes
@@ -0,0 +1,225 @@
+"""
+Tests for the real-time event system
+"""
+
+import pytest
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.remote_mcp.event_manager import (
+    Event,
+    EventFilter,
+    EventType,
+    RingEventQueue,
+    event_manager,
+    parse_event_seq
+)
+
+def make_event(n: int) -> Event:
+    return Event(
+        id=f"evt_{n}",
+        type=EventType.CUSTOM,
+        source="test",
+        target="note",
+        action="test",
+        data={"n": n}
+    )
+
+# ============================================================================
+# RING QUEUE TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestRingEventQueue:
+    """Test the per-connection ring buffer"""
+
+    async def test_fifo_order(self):
+        queue = RingEventQueue(4)
+        for n in range(3):
+            assert queue.put_nowait(make_event(n)) is True
+
+        assert queue.qsize() == 3
+        assert [(await queue.get()).data["n"] for _ in range(3)] == [0, 1, 2]
+        assert queue.empty()
+
+    async def test_overwrites_oldest_when_full(self):
+        queue = RingEventQueue(2)
+        queue.put_nowait(make_event(0))
+        queue.put_nowait(make_event(1))
+
+        assert queue.put_nowait(make_event(2)) is False
+        assert queue.dropped == 1
+        assert queue.get_nowait().data["n"] == 1
+        assert queue.get_nowait().data["n"] == 2
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    async def test_get_waits_for_producer(self):
+        queue = RingEventQueue(2)
+        consumer = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not consumer.done()
+
+        queue.put_nowait(make_event(7))
+        event = await asyncio.wait_for(consumer, timeout=1)
+        assert event.data["n"] == 7
+
+    async def test_get_timeout(self):
+        queue = RingEventQueue(2)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.get(), timeout=0.01)
+
+# ============================================================================
+# CHANGELOG TESTS
+# ============================================================================
+
+async def emit_test_events(count: int) -> list:
+    return [
+        await event_manager.emit(
+            event_type=EventType.CUSTOM,
+            source="test",
+            target="sync",
+            action="test",
+            data={"n": n}
+        )
+        for n in range(count)
+    ]
+
+def test_sse_frame_shared():
+    event = make_event(3)
+    frame = event.sse_frame
+
+    assert frame is event.sse_frame
+    assert frame.startswith(b"id: evt_3\nevent: custom\ndata: ")
+    assert frame.endswith(b"\n\n")
+    assert json.loads(frame.split(b"data: ", 1)[1]) == event.to_dict()
+
+def test_parse_event_seq():
+    assert parse_event_seq("evt_42") == 42
+    assert parse_event_seq("42") == 42
+    assert parse_event_seq("2024-01-01T00:00:00") is None
+    assert parse_event_seq(None) is None
+    assert parse_event_seq("evt_\u00b2") is None
+
+@pytest.mark.asyncio
+class TestSyncChanges:
+    """Test catch-up through the monotonic event changelog"""
+
+    async def test_event_ids_are_monotonic(self):
+        first, second = await emit_test_events(2)
+
+        assert second.seq == first.seq + 1
+        assert second.id == f"evt_{second.seq}"
+
+    async def test_sync_from_event_id(self):
+        events = await emit_test_events(3)
+
+        result = await event_manager.sync_changes("test", last_sync_id=events[0].id)
+
+        assert [e["id"] for e in result["events"]] == [events[1].id, events[2].id]
+        assert result["next_sync_id"] == events[2].id
+
+    async def test_sync_when_up_to_date(self):
+        events = await emit_test_events(1)
+
+        result = await event_manager.sync_changes("test", last_sync_id=events[0].id)
+
+        assert result["events"] == []
+        assert result["next_sync_id"] == events[0].id
+
+    async def test_filter_since_event_id(self):
+        first, second = await emit_test_events(2)
+        event_filter = EventFilter(since=first.id)
+
+        assert not event_filter.matches(first)
+        assert event_filter.matches(second)
+
+# ============================================================================
+# FAN-OUT TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestDistribution:
+    """Test subscription-indexed delivery and long-poll limits"""
+
+    async def test_delivered_once_per_connection(self):
+        pool = event_manager.connection_pool
+        conn = await pool.create_connection("test-fanout")
+        try:
+            pool.subscribe(conn, "fanout:*")
+            pool.subscribe(conn, "*:custom")
+
+            await event_manager.emit(
+                event_type=EventType.CUSTOM,
+                source="test",
+                target="fanout",
+                action="test",
+                data={}
+            )
+
+            assert conn.queue.qsize() == 1
+            assert "test-fanout" in pool.subscribers("fanout:*")
+        finally:
+            await pool.remove_connection("test-fanout")
+
+        assert "test-fanout" not in pool.subscribers("fanout:*")
+
+    async def test_wait_for_updates_wakes_on_emit(self):
+        waiter = asyncio.create_task(
+            event_manager.wait_for_updates("test-waiter", targets=["wake"], timeout=5)
+        )
+        await asyncio.sleep(0.01)
+        try:
+            await event_manager.emit(
+                event_type=EventType.CUSTOM,
+                source="test",
+                target="wake",
+                action="test",
+                data={"id": "x"}
+            )
+            result = await asyncio.wait_for(waiter, timeout=1)
+        finally:
+            await event_manager.connection_pool.remove_connection("test-waiter")
+
+        assert result["status"] == "updates"
+        assert result["events"][0]["target"] == "wake"
+
+    async def test_wait_times_out_without_free_slot(self, monkeypatch):
+        monkeypatch.setattr(event_manager, "_wait_slots", asyncio.Semaphore(0))
+
+        result = await event_manager.wait_for_updates("test-blocked", timeout=0.01)
+
+        assert result["status"] == "timeout"
+        assert "test-blocked" not in event_manager.connection_pool.connections
+
+# ============================================================================
+# STUB TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestEventManagerStub:
+    """Test the no-op fallback used when the event system is unavailable"""
+
+    async def test_stub_mirrors_event_types(self):
+        from src.remote_mcp import event_manager_stub as stub
+        from src.remote_mcp.event_manager import EventPriority
+
+        assert {e.name: e.value for e in stub.EventType} == {e.name: e.value for e in EventType}
+        assert {e.name: e.value for e in stub.EventPriority} == {e.name: e.value for e in EventPriority}
+
+    async def test_stub_decorator_is_transparent(self):
+        from src.remote_mcp import event_manager_stub as stub
+
+        @stub.emit_event(stub.EventType.CREATE, target="note", priority=stub.EventPriority.HIGH)
+        async def create_note(title: str):
+            """Create a note"""
+            return {"title": title}
+
+        assert create_note.__name__ == "create_note"
+        assert create_note.__doc__ == "Create a note"
+        assert await create_note("x") == {"title": "x"}
@@ -57,9 +57,8 @@ def test_server_creation():
     """Test server components"""
     print("\nTesting server components...")
     try:
-        from remote_mcp.server import mcp, tasks_db, task_counter
+        from remote_mcp.server import mcp, tasks_db
         print(f"  ✓ MCP server created: {mcp.name}")
-        print(f"  ✓ Task counter initialized: {task_counter}")
         print(f"  ✓ Tasks database ready: {len(tasks_db)} tasks")
         return True
     except Exception as e:
@@ -21,13 +21,12 @@ from src.remote_mcp.server import (
     task_update,
     task_delete,
     tasks_db,
-    task_counter,
     list_notes,
     get_note,
     write_note,
     delete_note,
     notes_db,
-    note_counter
+    sync_changes
 )
 
 # ============================================================================
@@ -36,23 +35,17 @@ from src.remote_mcp.server import (
 
 @pytest.fixture
 def setup_tasks():
-    """Reset task database before each test"""
-    global tasks_db, task_counter
+    """Reset task database (and its ID sequence) before each test"""
     tasks_db.clear()
-    task_counter = 0
     yield
     tasks_db.clear()
-    task_counter = 0
 
 @pytest.fixture
 def setup_notes():
-    """Reset notes database before each test"""
-    global notes_db, note_counter
+    """Reset notes database (and its ID sequence) before each test"""
     notes_db.clear()
-    note_counter = 0
     yield
     notes_db.clear()
-    note_counter = 0
 
 @pytest.fixture
 async def test_client():
@@ -164,6 +157,12 @@ class TestTextAnalysis:
         assert result["word_count"] == 6
         assert result["unique_words"] == 3
 
+    async def test_blank_sentences_ignored(self):
+        result = await text_analyze("One.. Two. . Three...")
+
+        assert result["sentence_count"] == 3
+        assert result["word_count"] == 4
+
 # ============================================================================
 # TASK MANAGEMENT TESTS
 # ============================================================================
@@ -477,6 +476,30 @@ class TestNotesManagement:
         assert note2["note"]["id"] in note_ids
         assert note3["note"]["id"] in note_ids
 
+# ============================================================================
+# SYNC TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestSyncChanges:
+    """Test catch-up with full state"""
+    
+    async def test_full_state_snapshot_reused_until_write(self, setup_notes, setup_tasks):
+        await write_note("Note 1", "Content 1", "Summary 1")
+        
+        first = await sync_changes(include_full_state=True)
+        second = await sync_changes(include_full_state=True)
+        
+        assert [n["title"] for n in first["state"]["notes"]] == ["Note 1"]
+        assert second["state"] is first["state"]
+        assert first["state_event_id"] is not None
+        
+        await task_create("Task 1")
+        third = await sync_changes(include_full_state=True)
+        
+        assert third["state"] is not first["state"]
+        assert [t["title"] for t in third["state"]["tasks"]] == ["Task 1"]
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
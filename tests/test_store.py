@@ -0,0 +1,172 @@
+"""
+Tests for the column-oriented notes/tasks storage
+"""
+
+import json
+import random
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.remote_mcp.store import NotesStore, TasksStore
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def make_note(note_id: str, tags: list) -> dict:
+    return {
+        "id": note_id,
+        "title": f"Title {note_id}",
+        "summary": f"Summary {note_id}",
+        "tags": tags,
+        "content": f"Content {note_id}",
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00"
+    }
+
+@pytest.fixture
+def notes():
+    store = NotesStore()
+    store["a"] = make_note("a", ["python", "code"])
+    store["b"] = make_note("b", ["java", "code"])
+    store["c"] = make_note("c", ["docker"])
+    return store
+
+# ============================================================================
+# NOTES STORE TESTS
+# ============================================================================
+
+class TestNotesStore:
+    """Test the notes store and its tag index"""
+
+    def test_mapping_protocol(self, notes):
+        assert len(notes) == 3
+        assert "a" in notes
+        assert "z" not in notes
+        assert notes["b"] == make_note("b", ["java", "code"])
+        assert notes.get("z") is None
+        assert notes.field("b", "title") == "Title b"
+        assert notes.field("z", "title", "missing") == "missing"
+        assert [n["id"] for n in notes.values()] == ["a", "b", "c"]
+
+    def test_pop(self, notes):
+        assert notes.pop("z") is None
+        assert notes.pop("a") == make_note("a", ["python", "code"])
+        assert "a" not in notes
+        assert notes.summaries(["python"]) == []
+        assert [n["id"] for n in notes.summaries(["code", "docker"])] == ["b", "c"]
+
+    def test_records(self, notes):
+        assert notes.records() == list(notes.values())
+        assert [n["id"] for n in notes.records([2, 0])] == ["c", "a"]
+
+    def test_summaries_by_tag(self, notes):
+        assert [n["id"] for n in notes.summaries(["code"])] == ["a", "b"]
+        assert [n["id"] for n in notes.summaries(["python", "docker"])] == ["a", "c"]
+        assert notes.summaries(["missing"]) == []
+        assert "content" not in notes.summaries()[0]
+
+    def test_delete_keeps_index_consistent(self, notes):
+        # Deleting the first row moves the last one into its slot
+        del notes["a"]
+
+        assert len(notes) == 2
+        assert notes["c"]["tags"] == ["docker"]
+        assert [n["id"] for n in notes.summaries(["docker"])] == ["c"]
+        assert [n["id"] for n in notes.summaries(["code"])] == ["b"]
+        assert notes.summaries(["python"]) == []
+        assert [n["id"] for n in notes.summaries(["code", "docker"])] == ["b", "c"]
+
+    def test_overwrite_reindexes(self, notes):
+        notes["a"] = make_note("a", ["rust"])
+
+        assert [n["id"] for n in notes.summaries(["rust"])] == ["a"]
+        assert [n["id"] for n in notes.summaries(["code"])] == ["b"]
+        assert [n["id"] for n in notes.values()] == ["a", "b", "c"]
+
+    def test_filtered_order_after_delete(self):
+        store = NotesStore()
+        for n in range(4):
+            store[f"n{n}"] = make_note(f"n{n}", ["x"])
+
+        del store["n0"]
+
+        assert [n["id"] for n in store.summaries()] == ["n1", "n2", "n3"]
+        assert [n["id"] for n in store.summaries(["x"])] == ["n1", "n2", "n3"]
+
+    def test_new_id(self):
+        store = NotesStore()
+
+        assert store.new_id("My First Note") == "my-first-note-1"
+        assert store.new_id("A Very Long Title That Should Be Truncated") == "a-very-long-title-that-should--2"
+
+    def test_duplicate_tags(self, notes):
+        notes["d"] = make_note("d", ["code", "code"])
+        del notes["d"]
+
+        assert [n["id"] for n in notes.summaries(["code", "code"])] == ["a", "b"]
+
+    def test_index_matches_full_scan(self):
+        rng = random.Random(7)
+        store = NotesStore()
+        tags = ["t0", "t1", "t2", "t3"]
+        for _ in range(500):
+            note_id = f"n{rng.randrange(20)}"
+            if note_id in store and rng.random() < 0.4:
+                del store[note_id]
+            else:
+                store[note_id] = make_note(note_id, rng.sample(tags, rng.randrange(3)))
+
+            query = rng.sample(tags, 2)
+            expected = [n["id"] for n in store.values() if set(n["tags"]) & set(query)]
+            assert [n["id"] for n in store.summaries(query)] == expected
+
+    def test_json_rendering_invalidated_on_write(self, notes):
+        first = notes.to_json("a")
+
+        assert json.loads(first) == notes["a"]
+        assert notes.to_json("a") is first
+
+        notes["a"] = make_note("a", ["rust"])
+        assert json.loads(notes.to_json("a"))["tags"] == ["rust"]
+
+        del notes["a"]
+        assert notes.to_json("a") is None
+
+    def test_clear(self, notes):
+        notes.clear()
+
+        assert len(notes) == 0
+        assert notes.summaries(["code"]) == []
+
+# ============================================================================
+# TASKS STORE TESTS
+# ============================================================================
+
+class TestTasksStore:
+    """Test the tasks store and its status index"""
+
+    def test_find_keeps_insertion_order_after_delete(self):
+        tasks = TasksStore()
+        for n in range(4):
+            tasks[f"t{n}"] = {"id": f"t{n}", "title": str(n), "status": "pending"}
+
+        del tasks["t1"]
+
+        assert [t["id"] for t in tasks.find("pending")] == ["t0", "t2", "t3"]
+        assert [t["id"] for t in tasks.find("pending")] == [t["id"] for t in tasks.find()]
+
+    def test_find_by_status(self):
+        tasks = TasksStore()
+        tasks["t1"] = {"id": "t1", "title": "One", "status": "pending"}
+        tasks["t2"] = {"id": "t2", "title": "Two", "status": "pending"}
+
+        tasks.update("t1", status="completed")
+
+        assert [t["id"] for t in tasks.find("pending")] == ["t2"]
+        assert [t["id"] for t in tasks.find("completed")] == ["t1"]
+        assert len(tasks.find()) == 2